@@ -1,4 +1,4 @@
 from .onset import detect_onset
-from .background import autosplit_gauss, autosplit_gauss_mask, autosplit_poisson, autosplit_poisson_mask
+from .background import autosplit_gauss, autosplit_gauss_mask, autosplit_poisson, autosplit_poisson_mask, intervals_from_mask, interval_bounds_from_mask
 
-__all__ = ['detect_onset', "autosplit_gauss", "autosplit_gauss_mask", "intervals_from_mask", "autosplit_poisson", "autosplit_poisson_mask"]
\ No newline at end of file
+__all__ = ['detect_onset', "autosplit_gauss", "autosplit_gauss_mask", "intervals_from_mask", "interval_bounds_from_mask", "autosplit_poisson", "autosplit_poisson_mask"]
\ No newline at end of file
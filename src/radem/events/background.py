@@ -1,67 +1,109 @@
 import pandas as pd
 import numpy as np
-from scipy.stats import zscore
+
+
+def _mask_edges(mask):
+    # Rising edges of the mask mark interval starts and falling edges mark the
+    # sample after an interval end. Padding with zeros closes intervals that
+    # touch either end of the signal. Boolean masks are reinterpreted as int8
+    # without a copy, and the int8 padding keeps the difference in int8 too.
+    mask = np.asarray(mask, dtype=np.bool_)
+    changes = np.diff(mask.view(np.int8), prepend=np.int8(0), append=np.int8(0))
+    starts = np.flatnonzero(changes == 1)
+    ends = np.flatnonzero(changes == -1) - 1
+    return starts, ends
+
+
+def interval_bounds_from_mask(mask, signal):
+    # Same intervals as intervals_from_mask, returned as two NumPy arrays of
+    # start and end times for vectorized downstream processing.
+    starts, ends = _mask_edges(mask)
+    times = signal["time"].to_numpy()
+    return times[starts], times[ends]
+
 
 def intervals_from_mask(mask, signal):
-    intervals = []
-    start_idx = None
+    starts, ends = _mask_edges(mask)
 
-    for i, is_anomalous in enumerate(mask):
-        if is_anomalous and start_idx is None:
-            start_idx = i
-        elif not is_anomalous and start_idx is not None:
-            start_time = signal["time"].iloc[start_idx]
-            end_time = signal["time"].iloc[i - 1]
-            intervals.append((start_time, end_time))
-            start_idx = None
+    # The backing array keeps element types stable (e.g. Timestamps for
+    # datetime columns) while being indexed with all edges at once.
+    times = signal["time"].array
+    return list(zip(times[starts], times[ends]))
 
-    if start_idx is not None:
-        start_time = signal["time"].iloc[start_idx]
-        end_time = signal["time"].iloc[len(mask) - 1]
-        intervals.append((start_time, end_time))
 
-    return intervals
+def _window_means(values, window_size):
+    # Mean of every full window values[i : i + window_size], i.e. one entry
+    # per window start. min_periods=1 keeps the NaN-skipping behaviour of
+    # Series.mean() for windows containing missing values.
+    rolling_means = values.rolling(window_size, min_periods=1).mean().to_numpy()
+    return rolling_means[window_size - 1:]
 
 
-def autosplit_gauss_mask(background_noise, signal, window_size, threshold):
-    noise_mean = background_noise["value"].mean()
-    noise_std = background_noise["value"].std()
+def _mask_from_windows(hot_windows, window_size, length):
+    # Mark every sample covered by at least one window flagged in hot_windows,
+    # where hot_windows[i] refers to the window starting at sample i. Each
+    # flagged window adds +1 at its first sample and -1 past its last one, so
+    # a running sum gives the number of flagged windows covering each sample.
+    starts = np.flatnonzero(hot_windows)
+    edges = np.zeros(length + 1, dtype=np.intp)
+    edges[starts] += 1
+    edges[starts + window_size] -= 1
+    return np.cumsum(edges[:length]) > 0
 
-    mask = pd.Series(False, index=signal.index)
 
-    for i in range(len(signal) - window_size + 1):
-        window = signal["value"].iloc[i : i + window_size]
+def _background_mean(background_noise):
+    # NaN-skipping like Series.mean().
+    return np.nanmean(background_noise["value"].to_numpy())
 
-        window_mean = window.mean()
-        z_score = (window_mean - noise_mean) / noise_std
 
-        if abs(z_score) > threshold:
-            mask.iloc[i : i + window_size] = True
+def _background_std(background_noise):
+    # Sample standard deviation (ddof=1), matching Series.std().
+    return np.nanstd(background_noise["value"].to_numpy(), ddof=1)
 
-    return mask
 
-def autosplit_gauss(background_noise, signal, window_size=2*24*60, threshold=2):
-    mask = autosplit_gauss_mask(background_noise, signal, window_size, threshold)
-    return intervals_from_mask(mask, signal)
+def _gauss_mask(background_noise, signal, window_size, threshold, noise_mean, noise_std):
+    # Background statistics can be precomputed by callers that split many
+    # signal chunks against the same background.
+    if noise_mean is None:
+        noise_mean = _background_mean(background_noise)
+    if noise_std is None:
+        noise_std = _background_std(background_noise)
+
+    # |z| > threshold with z = (mean - noise_mean) / noise_std, with the
+    # division folded into a single scalar threshold.
+    window_means = _window_means(signal["value"], window_size)
+    hot_windows = np.abs(window_means - noise_mean) > threshold * noise_std
 
+    return _mask_from_windows(hot_windows, window_size, len(signal))
 
-def autosplit_poisson_mask(background_noise, signal, window_size, threshold):
-    p_lambda = background_noise["value"].mean()
 
-    mask = pd.Series(False, index=signal.index)
+def _poisson_mask(background_noise, signal, window_size, threshold, noise_mean):
+    p_lambda = _background_mean(background_noise) if noise_mean is None else noise_mean
 
-    for i in range(len(signal) - window_size + 1):
-        window = signal["value"].iloc[i : i + window_size]
+    # |z| > threshold with z = (mean - p_lambda) / sqrt(p_lambda / window_size),
+    # with the division folded into a single scalar threshold.
+    window_means = _window_means(signal["value"], window_size)
+    hot_windows = np.abs(window_means - p_lambda) > threshold * np.sqrt(p_lambda / window_size)
 
-        window_mean = window.mean()
-        z_score = (window_mean - p_lambda) / np.sqrt(p_lambda / window_size)
+    return _mask_from_windows(hot_windows, window_size, len(signal))
 
-        if abs(z_score) > threshold:
-            mask.iloc[i : i + window_size] = True
 
-    return mask
+def autosplit_gauss_mask(background_noise, signal, window_size, threshold, noise_mean=None, noise_std=None):
+    mask = _gauss_mask(background_noise, signal, window_size, threshold, noise_mean, noise_std)
+    return pd.Series(mask, index=signal.index, copy=False)
 
 
-def autosplit_poisson(background_noise, signal, window_size=2*24*60, threshold=2):
-    mask = autosplit_poisson_mask(background_noise, signal, window_size, threshold)
-    return intervals_from_mask(mask, signal)
\ No newline at end of file
+def autosplit_gauss(background_noise, signal, window_size=2*24*60, threshold=2, noise_mean=None, noise_std=None):
+    # intervals_from_mask works on the raw boolean array, so skip the Series wrapper.
+    mask = _gauss_mask(background_noise, signal, window_size, threshold, noise_mean, noise_std)
+    return intervals_from_mask(mask, signal)
+
+
+def autosplit_poisson_mask(background_noise, signal, window_size, threshold, noise_mean=None):
+    mask = _poisson_mask(background_noise, signal, window_size, threshold, noise_mean)
+    return pd.Series(mask, index=signal.index, copy=False)
+
+
+def autosplit_poisson(background_noise, signal, window_size=2*24*60, threshold=2, noise_mean=None):
+    mask = _poisson_mask(background_noise, signal, window_size, threshold, noise_mean)
+    return intervals_from_mask(mask, signal)
@@ -1,6 +1,33 @@
 import pandas as pd
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:
+    # numba is an optional dependency, without it the CUSUM loop runs as plain Python.
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+
+@njit(cache=True)
+def _cusum_onset(normalized_flux: np.ndarray, k: float, hastiness: float, window: int, start: int = 1) -> int:
+    alert = 0  # Tracks consecutive exceedances of the threshold.
+    previous_cusum, cusum = 0.0, 0.0
+
+    for i in range(start, len(normalized_flux)):
+        increment = normalized_flux[i] - k + previous_cusum
+        # Same as max(0, increment), including NaN handling.
+        previous_cusum, cusum = cusum, increment if increment > 0 else 0.0
+
+        # Increment alert counter if CUSUM exceeds the hastiness threshold.
+        # If alert reaches the required window size, return the onset position.
+        alert = alert + 1 if cusum > hastiness else 0
+        if alert == window:
+            return i - alert
+
+    return -1
+
+
 def detect_onset(series: pd.Series, mean: float, sigma: float, window: int, critical_value: float = 2.0) -> pd.Timestamp | None:
     """
     Detects the onset time of an anomaly in a time series based on a CUSUM-like algorithm. Can be used for solar energetic particle detection.
@@ -38,21 +65,20 @@ def detect_onset(series: pd.Series, mean: float, sigma: float, window: int, crit
     k = (uncertainty_limit - mean) / (np.log1p(uncertainty_limit) - np.log1p(mean))
     hastiness = 1 if k < 1.0 else 2  # Determine the threshold for CUSUM alert triggering.
 
-    alert = 0  # Tracks consecutive exceedances of the threshold.
-    previous_cusum, cusum = 0, 0
+    k_int = round(k)  # The CUSUM uses the control parameter rounded to an integer.
 
-    onset_time = None
+    # Normalize the flux values based on the mean and sigma.
+    normalized_flux = (series.to_numpy(dtype=np.float64) - mean) / sigma
 
-    for i in range(1, len(series)):
-        # Normalize the current flux value based on the mean and sigma.
-        normalized_flux = (series.iloc[i] - mean) / sigma
-        previous_cusum, cusum = cusum, max(0, normalized_flux - round(k) + previous_cusum)
-        
-        # Increment alert counter if CUSUM exceeds the hastiness threshold.
-        # If alert reaches the required window size, register the onset time.
-        alert = alert + 1 if cusum > hastiness else 0
-        if alert == window:
-            onset_time = series.index[i - alert]
-            break
-    
-    return onset_time
+    # The CUSUM stays at zero, and so cannot raise an alert, until the first
+    # normalized value above k_int. Skip that quiet lead-in, or the whole series
+    # if no such value exists.
+    above_k = normalized_flux[1:] > k_int
+    if not above_k.any():
+        return None
+    start = int(above_k.argmax()) + 1
+
+    # The CUSUM recurrence cannot be vectorized, so it runs in a compiled kernel.
+    onset_position = _cusum_onset(normalized_flux, k_int, hastiness, window, start)
+
+    return series.index[onset_position] if onset_position >= 0 else None
@@ -9,6 +9,11 @@ from .hdf_handler import (
     append_hdf
 )
 
+from .parquet_handler import (
+    write_parquet,
+    read_parquet
+)
+
 from .irem_cdf_handler import (
     get_irem_cdf_paths,
     read_irem_cdf,
@@ -24,6 +29,7 @@ from .radem_cdf_handler import (
     read_radem_cdfs,
     read_radem_science_cdfs,
     read_radem_housekeeping_cdfs,
+    read_radem_science_df,
     convert_radem_science_cdf_to_df,
     convert_radem_housekeeping_cdf_to_df,
     convert_radem_science_cdfs_to_df
@@ -45,6 +51,7 @@ __all__ = [
     "read_radem_cdfs",
     "read_radem_science_cdfs",
     "read_radem_housekeeping_cdfs",
+    "read_radem_science_df",
     "convert_radem_science_cdf_to_df",
     "convert_radem_housekeeping_cdf_to_df",
     "convert_radem_science_cdfs_to_df",
@@ -54,6 +61,10 @@ __all__ = [
     'read_hdf',
     'append_hdf',
 
+    # parquet_handler
+    'write_parquet',
+    'read_parquet',
+
     # csv_handler
     'write_csv',
     'read_csv']
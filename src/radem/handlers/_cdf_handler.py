@@ -0,0 +1,64 @@
+import spacepy.pycdf as pycdf
+import numpy as np
+
+from pathlib import Path
+from typing import Callable, Dict, List
+
+
+def _read_cdf_variable(cdf: pycdf.CDF, name: str) -> np.ndarray:
+    return cdf[name][...]
+
+
+def _get_cdf_variable_dtype(cdf: pycdf.CDF, name: str) -> np.dtype:
+    return np.dtype(cdf[name].dtype)
+
+
+def get_cdf_record_count(cdf: pycdf.CDF, names: List[str]) -> int:
+    # Variables of one CDF are joined record by record, so their lengths
+    # have to agree within every file, not only in total
+    counts = {name: len(cdf[name]) for name in names}
+    if len(set(counts.values())) > 1:
+        raise ValueError(f"CDF variables have different record counts: "
+                         f"{counts}")
+    return counts[names[0]]
+
+
+def read_cdf_variables(
+        cdfs: List[pycdf.CDF],
+        names: List[str],
+        read_variable: Callable[[pycdf.CDF, str], np.ndarray]
+        = _read_cdf_variable,
+        get_variable_dtype: Callable[[pycdf.CDF, str], np.dtype]
+        = _get_cdf_variable_dtype) -> Dict[str, np.ndarray]:
+    # Read each variable of all CDFs into one array allocated at its final
+    # size and promoted dtype (like np.concatenate), file by file
+    if not cdfs:
+        raise ValueError("No CDFs to convert")
+
+    offsets = np.cumsum([0] + [get_cdf_record_count(cdf, names)
+                               for cdf in cdfs])
+
+    data = {}
+    for name in names:
+        dtype = np.result_type(*[get_variable_dtype(cdf, name)
+                                 for cdf in cdfs])
+        shape = (offsets[-1], *cdfs[0][name].shape[1:])
+        data[name] = np.empty(shape, dtype=dtype)
+
+    for cdf, start, stop in zip(cdfs, offsets[:-1], offsets[1:]):
+        for name in names:
+            values = read_variable(cdf, name)
+            expected_shape = data[name][start:stop].shape
+            if values.shape != expected_shape:
+                raise ValueError(f"CDF variable {name} has shape "
+                                 f"{values.shape}, expected {expected_shape}")
+            data[name][start:stop] = values
+    return data
+
+
+def is_path_non_empty(path: Path) -> bool:
+    # A single stat() call covers both the existence and the size check
+    try:
+        return path.stat().st_size > 0
+    except FileNotFoundError:
+        return False
@@ -7,12 +7,17 @@ def write_csv(df: pd.DataFrame, path: Path) -> None:
 
 
 def read_csv(path: Path) -> pd.DataFrame:
-    df = pd.read_csv(path)
+    # PyArrow parses the file on several threads, timestamps included
+    df = pd.read_csv(path, engine="pyarrow")
 
     # Set "time" column as index
     df.set_index('time', inplace=True)
 
-    # Convert index to datetime[ns]
-    df.index = pd.to_datetime(df.index, unit='ns')
+    # Convert index to datetime[ns], PyArrow may infer a coarser unit
+    df.index = pd.to_datetime(df.index)
+    if df.index.tz is None:
+        df.index = df.index.astype('datetime64[ns]')
+    else:
+        df.index = df.index.astype(pd.DatetimeTZDtype('ns', df.index.tz))
 
     return df
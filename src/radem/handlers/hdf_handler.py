@@ -1,23 +1,63 @@
 import pandas as pd
 from pathlib import Path
+from typing import Union
 
 _HDF5_KEY = "df"
 
+# Blosc ships with PyTables, is fast to (de)compress and byte-shuffles the
+# numeric columns, which shrinks count tables several times
+_HDF5_COMPLIB = "blosc:lz4"
+_HDF5_COMPLEVEL = 5
 
-def write_hdf(df: pd.DataFrame, path: Path) -> None:
-    df.to_hdf(path,
-              key=_HDF5_KEY,
-              mode="a",
-              format='table')
 
+def _write_hdf(df: pd.DataFrame,
+               path: Union[Path, pd.HDFStore],
+               mode: str,
+               append: bool,
+               complib: str,
+               complevel: int) -> None:
+    # PyTables can't store an empty table, so nothing is written (and
+    # write_hdf doesn't truncate the file) for an empty frame
+    if df.empty:
+        return
 
-def append_hdf(df: pd.DataFrame, path: Path) -> None:
-    df.to_hdf(path,
-              key=_HDF5_KEY,
-              mode="a",
-              format='table',
-              append=True)
+    # DataFrame.to_hdf ignores complib/complevel for an open store
+    if isinstance(path, pd.HDFStore):
+        path.put(_HDF5_KEY,
+                 df,
+                 format='table',
+                 append=append,
+                 complib=complib,
+                 complevel=complevel)
+    else:
+        df.to_hdf(path,
+                  key=_HDF5_KEY,
+                  mode=mode,
+                  format='table',
+                  append=append,
+                  complib=complib,
+                  complevel=complevel)
 
 
-def read_hdf(path: Path) -> pd.DataFrame:
+def write_hdf(df: pd.DataFrame,
+              path: Union[Path, pd.HDFStore],
+              complib: str = _HDF5_COMPLIB,
+              complevel: int = _HDF5_COMPLEVEL,
+              mode: str = "w") -> None:
+    # The defaults favour speed, e.g. complib="zlib" trades it for smaller
+    # archival files. mode="w" truncates the file, dropping any other nodes,
+    # mode="a" only replaces the table.
+    _write_hdf(df, path, mode, False, complib, complevel)
+
+
+def append_hdf(df: pd.DataFrame,
+               path: Union[Path, pd.HDFStore],
+               complib: str = _HDF5_COMPLIB,
+               complevel: int = _HDF5_COMPLEVEL) -> None:
+    # The compression only applies when the table is created, appending to
+    # an existing table keeps the settings it was created with
+    _write_hdf(df, path, "a", True, complib, complevel)
+
+
+def read_hdf(path: Union[Path, pd.HDFStore]) -> pd.DataFrame:
     return pd.read_hdf(path, key=_HDF5_KEY)
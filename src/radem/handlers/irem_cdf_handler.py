@@ -1,16 +1,19 @@
 import spacepy.pycdf as pycdf
 import pandas as pd
+import numpy as np
 import re
 
 from pathlib import Path
-from typing import List, Optional, overload, Union
-from datetime import date, datetime
+from typing import Dict, List, Optional, overload, Union
+from datetime import date
+
+from ._cdf_handler import is_path_non_empty, read_cdf_variables
 
 
 def get_irem_cdf_paths(data_dir: Path,
                        from_date: Optional[date] = None,
                        to_date: Optional[date] = None) -> List[Path]:
-    path_generator = data_dir.glob("*.cdf")
+    path_generator = data_dir.glob("IREM_PACC_*.cdf")
     paths = [path for path in path_generator
              if _is_irem_cdf_path_valid(path, from_date, to_date)]
     paths.sort()
@@ -43,43 +46,52 @@ def read_irem_cdfs(arg0: Union[List[Path], Path],
     return [read_irem_cdf(path) for path in paths]
 
 
+_IREM_CDF_VARIABLES = ["EPOCH", "COUNTRATE", "ORBIT", "MAGFIELD", "LSHELL"]
+
+
 def convert_irem_cdf_to_df(cdf: pycdf.CDF) -> pd.DataFrame:
+    data = {name: cdf[name][...] for name in _IREM_CDF_VARIABLES}
+    return _convert_irem_data_to_df(data)
+
+
+def _convert_irem_data_to_df(data: Dict[str, np.ndarray]) -> pd.DataFrame:
     # According do the IREM User Manual:
     # * label_COUNTERS[0:5] is [TC1 S12 S13 S14 S15] which is D1
     # * label_COUNTERS[5:7] is [TC2 S25] which is D2
     # * label_COUNTERS[7:11] is [C1 C2 C3 C4] which is D1+D2 Coincidence
     # * label_COUNTERS[11:15] is [TC3 S32 S33 S34] which is D3
     df = pd.DataFrame({
-        "time": cdf["EPOCH"][...],
-        "d1_channel1":  cdf["COUNTRATE"][..., 0],
-        "d1_channel2":  cdf["COUNTRATE"][..., 1],
-        "d1_channel3":  cdf["COUNTRATE"][..., 2],
-        "d1_channel4":  cdf["COUNTRATE"][..., 3],
-        "d1_channel5":  cdf["COUNTRATE"][..., 4],
-        "d2_channel1":  cdf["COUNTRATE"][..., 5],
-        "d2_channel2":  cdf["COUNTRATE"][..., 6],
-        "coincidence_channel1":   cdf["COUNTRATE"][..., 7],
-        "coincidence_channel2":   cdf["COUNTRATE"][..., 8],
-        "coincidence_channel3":   cdf["COUNTRATE"][..., 9],
-        "coincidence_channel4":   cdf["COUNTRATE"][..., 10],
-        "d3_channel1":  cdf["COUNTRATE"][..., 11],
-        "d3_channel2":  cdf["COUNTRATE"][..., 12],
-        "d3_channel3":  cdf["COUNTRATE"][..., 13],
-        "d3_channel4":  cdf["COUNTRATE"][..., 14],
-        "orbit_x_eci_km":  cdf["ORBIT"][..., 0],
-        "orbit_y_eci_km":  cdf["ORBIT"][..., 1],
-        "orbit_z_eci_km":  cdf["ORBIT"][..., 2],
-        "magfield_bx_eci_gauss":  cdf["MAGFIELD"][..., 0],
-        "magfield_by_eci_gauss":  cdf["MAGFIELD"][..., 1],
-        "magfield_bz_eci_gauss":  cdf["MAGFIELD"][..., 2],
-        "magfield_lshell_re":  cdf["LSHELL"][..., 0],
+        "time": data["EPOCH"],
+        "d1_channel1":  data["COUNTRATE"][..., 0],
+        "d1_channel2":  data["COUNTRATE"][..., 1],
+        "d1_channel3":  data["COUNTRATE"][..., 2],
+        "d1_channel4":  data["COUNTRATE"][..., 3],
+        "d1_channel5":  data["COUNTRATE"][..., 4],
+        "d2_channel1":  data["COUNTRATE"][..., 5],
+        "d2_channel2":  data["COUNTRATE"][..., 6],
+        "coincidence_channel1":   data["COUNTRATE"][..., 7],
+        "coincidence_channel2":   data["COUNTRATE"][..., 8],
+        "coincidence_channel3":   data["COUNTRATE"][..., 9],
+        "coincidence_channel4":   data["COUNTRATE"][..., 10],
+        "d3_channel1":  data["COUNTRATE"][..., 11],
+        "d3_channel2":  data["COUNTRATE"][..., 12],
+        "d3_channel3":  data["COUNTRATE"][..., 13],
+        "d3_channel4":  data["COUNTRATE"][..., 14],
+        "orbit_x_eci_km":  data["ORBIT"][..., 0],
+        "orbit_y_eci_km":  data["ORBIT"][..., 1],
+        "orbit_z_eci_km":  data["ORBIT"][..., 2],
+        "magfield_bx_eci_gauss":  data["MAGFIELD"][..., 0],
+        "magfield_by_eci_gauss":  data["MAGFIELD"][..., 1],
+        "magfield_bz_eci_gauss":  data["MAGFIELD"][..., 2],
+        "magfield_lshell_re":  data["LSHELL"][..., 0],
     })
 
     # Raw CDFs might contain duplicates, so we need to drop them
     df.drop_duplicates(inplace=True)
 
-    # We need to sort after dropping duplicates
-    df.sort_values('time', inplace=True)
+    # We need to sort after dropping duplicates, unless already in order
+    if not df['time'].is_monotonic_increasing:
+        df.sort_values('time', inplace=True)
 
     # Set time as index
     df.set_index('time', inplace=True)
@@ -88,14 +100,17 @@ def convert_irem_cdf_to_df(cdf: pycdf.CDF) -> pd.DataFrame:
 
 
 def convert_irem_cdfs_to_df(cdfs: List[pycdf.CDF]) -> pd.DataFrame:
-    df = pd.concat([convert_irem_cdf_to_df(cdf) for cdf in cdfs])
-    return df
+    data = read_cdf_variables(cdfs, _IREM_CDF_VARIABLES)
+    return _convert_irem_data_to_df(data)
 
 
 def _convert_irem_cdf_path_to_date(path: Path) -> date:
     path = str(path.name)
     date_str = path[10:18]
-    file_date = datetime.strptime(date_str, "%Y%m%d").date()
+    # The name pattern guarantees 8 digits, so no strptime is needed
+    file_date = date(int(date_str[0:4]),
+                     int(date_str[4:6]),
+                     int(date_str[6:8]))
     return file_date
 
 
@@ -110,34 +125,27 @@ def _is_irem_cdf_path_in_date_range(path: Path,
     return True
 
 
-def _is_irem_cdf_path_naming_correct(path: Path) -> bool:
-    # NOTE: Be aware that there are a couple of files what don't follow
-    # this convention and can introduce data duplicates e.g.:
-    # * IREM_PACC_20030128_exp.cdf
-    # * IREM_PACC_20030128_pow.cdf
-    # * IREM_PACC_20030128.cdf
-    # and others
-    pattern = re.compile(r"IREM_PACC_\d{8}\.cdf")
-    return pattern.match(path.name)
+# NOTE: Be aware that there are a couple of files what don't follow
+# this convention and can introduce data duplicates e.g.:
+# * IREM_PACC_20030128_exp.cdf
+# * IREM_PACC_20030128_pow.cdf
+# * IREM_PACC_20030128.cdf
+# and others
+_IREM_CDF_NAME_PATTERN = re.compile(r"IREM_PACC_\d{8}\.cdf")
 
 
-def _is_path_existing(path: Path) -> bool:
-    return path.exists()
-
-
-def _is_path_empty(path: Path) -> bool:
-    return path.stat().st_size == 0
+def _is_irem_cdf_path_naming_correct(path: Path) -> bool:
+    return _IREM_CDF_NAME_PATTERN.match(path.name) is not None
 
 
 def _is_irem_cdf_path_valid(path: Path,
                             from_date: Optional[date] = None,
                             to_date: Optional[date] = None) -> bool:
+    # Cheap name-based checks go first, stat() only runs for candidates
     if not _is_irem_cdf_path_naming_correct(path):
         return False
-    if not _is_path_existing(path):
-        return False
-    if _is_path_empty(path):
-        return False
     if not _is_irem_cdf_path_in_date_range(path, from_date, to_date):
         return False
+    if not is_path_non_empty(path):
+        return False
     return True
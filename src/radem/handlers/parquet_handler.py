@@ -0,0 +1,11 @@
+import pandas as pd
+from pathlib import Path
+
+
+def write_parquet(df: pd.DataFrame, path: Path) -> None:
+    # Parquet keeps the column dtypes and the datetime index
+    df.to_parquet(path, engine="pyarrow", compression="zstd")
+
+
+def read_parquet(path: Path) -> pd.DataFrame:
+    return pd.read_parquet(path, engine="pyarrow")
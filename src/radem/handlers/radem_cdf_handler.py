@@ -1,11 +1,18 @@
 import spacepy.pycdf as pycdf
 import pandas as pd
 import numpy as np
+import functools
 import re
 
 from pathlib import Path
-from typing import List, Optional
-from datetime import date, datetime
+from typing import Dict, List, Optional
+from datetime import date, datetime, timedelta
+
+from ._cdf_handler import (
+    get_cdf_record_count,
+    is_path_non_empty,
+    read_cdf_variables
+)
 
 
 def get_radem_science_cdf_paths(data_dir: Path,
@@ -14,7 +21,8 @@ def get_radem_science_cdf_paths(data_dir: Path,
     # NOTE: from_date and to_date are used but the date inside file might be
     #       different so we need to check if the file is in the date range
 
-    path_generator = data_dir.rglob("*.cdf")
+    # The glob only matches science CDF file names
+    path_generator = data_dir.rglob("rad_raw_sc_*.cdf")
     paths = [path for path in path_generator
              if _is_radem_science_cdf_path_valid(path, from_date, to_date)]
     paths.sort()
@@ -25,7 +33,7 @@ def get_radem_housekeeping_cdf_paths(data_dir: Path,
                                      from_date: Optional[date] = None,
                                      to_date: Optional[date] = None) \
         -> List[Path]:
-    path_generator = data_dir.rglob("*.cdf")
+    path_generator = data_dir.rglob("rad_raw_hk_*.cdf")
     paths = [path for path in path_generator
              if _is_radem_housekeeping_cdf_path_valid(path,
                                                       from_date,
@@ -51,54 +59,139 @@ def read_radem_science_cdfs(data_dir: Path,
 
 def read_radem_housekeeping_cdfs(data_dir: Path,
                                  from_date: Optional[date] = None,
-                                 to_date: Optional[date] = None) -> List[pycdf.CDF]:
+                                 to_date: Optional[date] = None) \
+        -> List[pycdf.CDF]:
     paths = get_radem_housekeeping_cdf_paths(data_dir, from_date, to_date)
     return read_radem_cdfs(paths)
 
 
+_RADEM_SCIENCE_CDF_VARIABLES = ["TIME_UTC",
+                                "PROTONS",
+                                "ELECTRONS",
+                                "DD",
+                                "HI_IONS",
+                                "FLUX"]
+_RADEM_SCIENCE_DATA_START = pd.Timestamp("2023-09-01")
+
+
+_UNIX_EPOCH = datetime(1970, 1, 1)
+
+# Time unit of every RADEM frame, the only one all supported pandas have
+_RADEM_TIME_DTYPE = np.dtype("datetime64[ns]")
+
+# TT2000 pad value, the only epoch below it is the fill value
+_TT2000_PAD = np.iinfo(np.int64).min + 1
+
+
+def _tt2000_to_unix_ns_offset(tt2000: int) -> int:
+    # Difference between the Unix time and TT2000 at the given instant,
+    # computed on a whole microsecond since that is datetime's precision
+    tt2000 -= tt2000 % 1000
+    delta = pycdf.lib.tt2000_to_datetime(tt2000) - _UNIX_EPOCH
+    return delta // timedelta(microseconds=1) * 1000 - tt2000
+
+
+def _read_radem_cdf_times(cdf: pycdf.CDF) -> np.ndarray:
+    # pycdf converts TT2000 epochs to an object array of datetimes one
+    # element at a time. TT2000 only differs from Unix time by a constant
+    # between leap seconds, so when none falls inside the file the raw
+    # int64 epochs are shifted and reinterpreted in a single pass. Both
+    # paths round to the nearest microsecond like pycdf's datetimes and
+    # return _RADEM_TIME_DTYPE, so arrays of different CDFs concatenate.
+    var = cdf["TIME_UTC"]
+    if var.type() != pycdf.const.CDF_TIME_TT2000.value or len(var) == 0:
+        # Unlike NumPy, pandas raises for epochs out of the nanosecond range
+        return pd.to_datetime(var[...]).astype(_RADEM_TIME_DTYPE).to_numpy()
+
+    # Fill and pad epochs mark records without a time, they become NaT
+    raw = cdf.raw_var("TIME_UTC")[...]
+    missing = raw <= _TT2000_PAD
+    valid = raw[~missing]
+    offset = _tt2000_to_unix_ns_offset(int(valid.min())) if valid.size else 0
+    if not valid.size or \
+            offset == _tt2000_to_unix_ns_offset(int(valid.max())):
+        raw += offset + 500
+        raw //= 1000
+        raw *= 1000
+        raw[missing] = np.datetime64("NaT").astype(np.int64)
+        return raw.view(_RADEM_TIME_DTYPE)
+
+    times = np.full(raw.shape, np.datetime64("NaT"), dtype=_RADEM_TIME_DTYPE)
+    times[~missing] = pd.to_datetime(var[...][~missing]) \
+        .astype(_RADEM_TIME_DTYPE).to_numpy()
+    return times
+
+
+def _read_radem_cdf_variable(cdf: pycdf.CDF, name: str) -> np.ndarray:
+    if name == "TIME_UTC":
+        return _read_radem_cdf_times(cdf)
+    return cdf[name][...]
+
+
+def _get_radem_cdf_variable_dtype(cdf: pycdf.CDF, name: str) -> np.dtype:
+    # Without reading the data, pycdf reports TIME_UTC as object
+    if name == "TIME_UTC":
+        return _RADEM_TIME_DTYPE
+    return np.dtype(cdf[name].dtype)
+
+
 def convert_radem_science_cdf_to_df(cdf: pycdf.CDF) -> pd.DataFrame:
+    data = {name: _read_radem_cdf_variable(cdf, name)
+            for name in _RADEM_SCIENCE_CDF_VARIABLES}
+    return _convert_radem_science_data_to_df(data)
+
+
+def _convert_bins_to_df(values: np.ndarray, columns: List[str]) \
+        -> pd.DataFrame:
+    return pd.DataFrame(values[:, :len(columns)], columns=columns, copy=False)
+
+
+def _convert_radem_science_data_to_df(data: Dict[str, np.ndarray]) \
+        -> pd.DataFrame:
     NO_OF_PROTON_BINS = 8
     NO_OF_ELECTRON_BINS = 8
     NO_OF_DIRECTIONAL_BINS = 31
     NO_OF_HI_ION_BINS = 7
 
-    df = pd.DataFrame({
-        "time": cdf["TIME_UTC"][...],
-        **{
-            f"protons_bin_{i+1}": cdf["PROTONS"][..., i]
-            for i in range(NO_OF_PROTON_BINS)
-        },
-        "proton_bin_others": cdf["PROTONS"][..., NO_OF_PROTON_BINS],
-        **{
-            f"electrons_bin_{i+1}": cdf["ELECTRONS"][..., i]
-            for i in range(NO_OF_ELECTRON_BINS)
-        },
-        "electron_bin_others": cdf["ELECTRONS"][..., NO_OF_ELECTRON_BINS],
-        **{
-            f"directional_bin_{i+1}": cdf["DD"][..., i]
-            for i in range(NO_OF_DIRECTIONAL_BINS)
-        },
-        **{
-            f"hi_ion_bin_{i+1}": cdf["HI_IONS"][..., i]
-            for i in range(NO_OF_HI_ION_BINS)
-        },
-        "hi_ion_bin_others": cdf["HI_IONS"][..., NO_OF_HI_ION_BINS],
-        "flux_protons": cdf["FLUX"][..., 0],
-        "flux_electrons": cdf["FLUX"][..., 1],
-        "flux_directional": cdf["FLUX"][..., 2],
-    })
+    # pd.concat would silently pad shorter variables with NaN
+    if len({len(values) for values in data.values()}) > 1:
+        raise ValueError("All arrays must be of the same length")
+
+    # Each multi-bin variable is added as a single 2-D block
+    df = pd.concat([
+        pd.DataFrame({"time": data["TIME_UTC"]}),
+        _convert_bins_to_df(
+            data["PROTONS"],
+            [f"protons_bin_{i+1}" for i in range(NO_OF_PROTON_BINS)]
+            + ["proton_bin_others"]),
+        _convert_bins_to_df(
+            data["ELECTRONS"],
+            [f"electrons_bin_{i+1}" for i in range(NO_OF_ELECTRON_BINS)]
+            + ["electron_bin_others"]),
+        _convert_bins_to_df(
+            data["DD"],
+            [f"directional_bin_{i+1}" for i in range(NO_OF_DIRECTIONAL_BINS)]),
+        _convert_bins_to_df(
+            data["HI_IONS"],
+            [f"hi_ion_bin_{i+1}" for i in range(NO_OF_HI_ION_BINS)]
+            + ["hi_ion_bin_others"]),
+        _convert_bins_to_df(
+            data["FLUX"],
+            ["flux_protons", "flux_electrons", "flux_directional"]),
+    ], axis=1)
 
     # Convert time to datetime and floor to seconds
     df["time"] = pd.to_datetime(df['time']).dt.floor('s')
 
     # Drop data before 2023-09-01, it hasn't scientific value
-    df.query("time >= '2023-09-01'", inplace=True)
+    df = df[df["time"] >= _RADEM_SCIENCE_DATA_START]
 
     # Raw CDFs might contain duplicates, so we need to drop them
     df.drop_duplicates(inplace=True)
 
-    # We need to sort after dropping duplicates
-    df.sort_values('time', inplace=True)
+    # We need to sort after dropping duplicates, unless already in order
+    if not df['time'].is_monotonic_increasing:
+        df.sort_values('time', inplace=True)
 
     # Set time as index
     df.set_index('time', inplace=True)
@@ -106,13 +199,28 @@ def convert_radem_science_cdf_to_df(cdf: pycdf.CDF) -> pd.DataFrame:
     return df
 
 
+# ADC reading -> kelvin, folded into a single factor, then kelvin -> celsius
+_HOUSEKEEPING_TEMP_SCALE = (3.3 / 4096) * (1000000 / 2210)
+_HOUSEKEEPING_TEMP_OFFSET = -273.16
+
+
 def _convert_housekeeping_temp(adc_out: np.ndarray) -> np.ndarray:
-    return np.round(adc_out * (3.3 / 4096) * (1000000 / 2210) - 273.16)
+    # Single temporary, the offset and rounding are applied in place
+    temp = np.multiply(adc_out, _HOUSEKEEPING_TEMP_SCALE)
+    temp += _HOUSEKEEPING_TEMP_OFFSET
+    np.round(temp, out=temp)
+
+    # Whole degrees of any unsigned 16-bit reading (at most about 23620)
+    # fit in int16, other inputs may hold NaN or overflow and stay float
+    if np.issubdtype(adc_out.dtype, np.unsignedinteger) \
+            and adc_out.dtype.itemsize <= 2:
+        return temp.astype(np.int16)
+    return temp
 
 
 def convert_radem_housekeeping_cdf_to_df(cdf: pycdf.CDF) -> pd.DataFrame:
     df = pd.DataFrame({
-        "time": cdf["TIME_UTC"][...],
+        "time": _read_radem_cdf_times(cdf),
         "ceu_temp_celsius":
             _convert_housekeeping_temp(cdf["HK_Temp1_CEU"][...]),
         "protons_and_hi_ions_temp_celsius":
@@ -128,14 +236,45 @@ def convert_radem_housekeeping_cdf_to_df(cdf: pycdf.CDF) -> pd.DataFrame:
 
 
 def convert_radem_science_cdfs_to_df(cdfs: List[pycdf.CDF]) -> pd.DataFrame:
-    df = pd.concat([convert_radem_science_cdf_to_df(cdf) for cdf in cdfs])
-    return df
+    data = read_cdf_variables(cdfs,
+                              _RADEM_SCIENCE_CDF_VARIABLES,
+                              _read_radem_cdf_variable,
+                              _get_radem_cdf_variable_dtype)
+    return _convert_radem_science_data_to_df(data)
+
+
+def read_radem_science_df(data_dir: Path,
+                          from_date: Optional[date] = None,
+                          to_date: Optional[date] = None) -> pd.DataFrame:
+    # Only one CDF is open at a time, each is closed before the next one
+    paths = get_radem_science_cdf_paths(data_dir, from_date, to_date)
+    if not paths:
+        raise ValueError("No CDFs to convert")
+
+    chunks = []
+    for path in paths:
+        with read_radem_cdf(path) as cdf:
+            get_cdf_record_count(cdf, _RADEM_SCIENCE_CDF_VARIABLES)
+            chunks.append({name: _read_radem_cdf_variable(cdf, name)
+                           for name in _RADEM_SCIENCE_CDF_VARIABLES})
+
+    data = {name: np.concatenate([chunk[name] for chunk in chunks])
+            for name in _RADEM_SCIENCE_CDF_VARIABLES}
+    return _convert_radem_science_data_to_df(data)
 
 
 def _convert_radem_cdf_path_to_date(path: Path) -> date:
-    path = str(path.name)
-    date_str = path[11:19]
-    file_date = datetime.strptime(date_str, "%Y%m%d").date()
+    return _convert_radem_cdf_name_to_date(path.name)
+
+
+# Repeated scans of a data directory decode the same names again
+@functools.lru_cache(maxsize=8192)
+def _convert_radem_cdf_name_to_date(name: str) -> date:
+    date_str = name[11:19]
+    # The name pattern guarantees 8 digits, so no strptime is needed
+    file_date = date(int(date_str[0:4]),
+                     int(date_str[4:6]),
+                     int(date_str[6:8]))
     return file_date
 
 
@@ -150,33 +289,26 @@ def _is_radem_cdf_path_in_date_range(path: Path,
     return True
 
 
-def _is_radem_science_cdf_path_naming_correct(path: Path) -> bool:
-    pattern = re.compile(r"rad_raw_sc_\d{8}.cdf")
-    return pattern.match(path.name)
-
-
-def _is_radem_housekeeping_cdf_path_naming_correct(path: Path) -> bool:
-    pattern = re.compile(r"rad_raw_hk_\d{8}.cdf")
-    return pattern.match(path.name)
+_RADEM_SCIENCE_CDF_NAME_PATTERN = re.compile(r"rad_raw_sc_\d{8}\.cdf")
+_RADEM_HOUSEKEEPING_CDF_NAME_PATTERN = re.compile(r"rad_raw_hk_\d{8}\.cdf")
 
 
-def _is_path_existing(path: Path) -> bool:
-    return path.exists()
+def _is_radem_science_cdf_path_naming_correct(path: Path) -> bool:
+    return _RADEM_SCIENCE_CDF_NAME_PATTERN.match(path.name) is not None
 
 
-def _is_path_empty(path: Path) -> bool:
-    return path.stat().st_size == 0
+def _is_radem_housekeeping_cdf_path_naming_correct(path: Path) -> bool:
+    return _RADEM_HOUSEKEEPING_CDF_NAME_PATTERN.match(path.name) is not None
 
 
 def _is_radem_cdf_path_valid(path: Path,
                              from_date: Optional[date] = None,
                              to_date: Optional[date] = None) -> bool:
-    if not _is_path_existing(path):
-        return False
-    if _is_path_empty(path):
-        return False
+    # Cheap name-based checks go first, stat() only runs for candidates
     if not _is_radem_cdf_path_in_date_range(path, from_date, to_date):
         return False
+    if not is_path_non_empty(path):
+        return False
     return True
 
 
@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import pytest
+import spacepy.pycdf as pycdf
+
+from datetime import datetime
+
+from radem.handlers import (
+    convert_radem_housekeeping_cdf_to_df,
+    convert_radem_science_cdf_to_df,
+    read_radem_science_df
+)
+
+_TT2000_FILL = np.iinfo(np.int64).min
+
+
+def _write_times(cdf, times, fill_index):
+    cdf.new("TIME_UTC", type=pycdf.const.CDF_TIME_TT2000)
+    cdf["TIME_UTC"][...] = times
+    cdf.raw_var("TIME_UTC")[fill_index] = _TT2000_FILL
+
+
+def _write_science_cdf(path, day, records, flux_records):
+    cdf = pycdf.CDF(str(path), "")
+    cdf["TIME_UTC"] = [datetime(2023, 9, day, 0, 0, s)
+                       for s in range(records)]
+    for name, bins in [("PROTONS", 9), ("ELECTRONS", 9), ("DD", 31),
+                       ("HI_IONS", 8)]:
+        cdf[name] = np.arange(records * bins,
+                              dtype=np.uint32).reshape(records, bins)
+    cdf["FLUX"] = np.ones((flux_records, 3))
+    cdf.close()
+
+
+@pytest.fixture
+def science_cdf(tmp_path):
+    cdf = pycdf.CDF(str(tmp_path / "rad_raw_sc_20230901.cdf"), "")
+    _write_times(cdf, [datetime(2023, 9, 1, 0, 0, s) for s in range(3)], 1)
+    for name, bins in [("PROTONS", 9), ("ELECTRONS", 9), ("DD", 31),
+                       ("HI_IONS", 8), ("FLUX", 3)]:
+        cdf[name] = np.arange(3 * bins, dtype=np.uint32).reshape(3, bins)
+    yield cdf
+    cdf.close()
+
+
+@pytest.fixture
+def housekeeping_cdf(tmp_path):
+    cdf = pycdf.CDF(str(tmp_path / "rad_raw_hk_20230901.cdf"), "")
+    # The first and last epochs are on either side of a leap second
+    _write_times(cdf, [datetime(2016, 12, 31, 23, 59, 59),
+                       datetime(2017, 1, 1),
+                       datetime(2017, 1, 1, 0, 0, 1)], 1)
+    for name in ["HK_Temp1_CEU", "HK_PandI_Stack_Temp2", "HK_E_Stack_Temp3",
+                 "HK_DD_Temp4", "HK_Temp5_CPU"]:
+        cdf[name] = np.full(3, 1000, dtype=np.uint16)
+    yield cdf
+    cdf.close()
+
+
+def test_science_fill_epoch_is_dropped(science_cdf):
+    df = convert_radem_science_cdf_to_df(science_cdf)
+
+    assert list(df.index) == [pd.Timestamp("2023-09-01 00:00:00"),
+                              pd.Timestamp("2023-09-01 00:00:02")]
+    assert df["protons_bin_1"].tolist() == [0, 18]
+
+
+def test_housekeeping_fill_epoch_is_nat(housekeeping_cdf):
+    df = convert_radem_housekeeping_cdf_to_df(housekeeping_cdf)
+
+    assert df["time"].dtype == np.dtype("datetime64[ns]")
+    assert df["time"].tolist()[0] == pd.Timestamp("2016-12-31 23:59:59")
+    assert df["time"].isna().tolist() == [False, True, False]
+    assert df["time"].tolist()[2] == pd.Timestamp("2017-01-01 00:00:01")
+
+
+def test_science_record_counts_are_checked_per_file(tmp_path):
+    # The totals agree (9 records each), the files don't
+    data_dir = tmp_path / "juice_rad" / "data_raw"
+    data_dir.mkdir(parents=True)
+    _write_science_cdf(data_dir / "rad_raw_sc_20230901.cdf", 1, 5, 4)
+    _write_science_cdf(data_dir / "rad_raw_sc_20230902.cdf", 2, 4, 5)
+
+    with pytest.raises(ValueError, match="record counts"):
+        read_radem_science_df(tmp_path)